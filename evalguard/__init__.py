@@ -1,6 +1,27 @@
 """EvalGuard - Simple validation for AI agent outputs."""
 
-from .core import Expectation, ValidationError, check, expect
+from .core import (
+    BytesExpectation,
+    Expectation,
+    ValidationError,
+    check,
+    check_batch,
+    check_many,
+    configure,
+    expect,
+    expect_bytes,
+)
 
 __version__ = "0.1.0"
-__all__ = ["Expectation", "ValidationError", "__version__", "check", "expect"]
+__all__ = [
+    "BytesExpectation",
+    "Expectation",
+    "ValidationError",
+    "__version__",
+    "check",
+    "check_batch",
+    "check_many",
+    "configure",
+    "expect",
+    "expect_bytes",
+]
@@ -4,14 +4,313 @@ from __future__ import annotations
 
 import json
 import re
-from functools import wraps
+import sys
+import threading
+from collections.abc import Iterable, Sized
+from functools import lru_cache, wraps
 from re import Pattern
-from typing import Any, Callable, TypeVar
-
-__all__ = ["Expectation", "ValidationError", "check", "expect"]
+from typing import Any, Callable, TypeVar, cast
+from weakref import WeakValueDictionary
+
+__all__ = [
+    "BytesExpectation",
+    "Expectation",
+    "ValidationError",
+    "check",
+    "check_batch",
+    "check_many",
+    "configure",
+    "expect",
+    "expect_bytes",
+]
 
 T = TypeVar("T")
 
+# Every compiled pattern that is still referenced somewhere (typically by a
+# @check decorator). Entries disappear when the Pattern is garbage collected,
+# so this never grows beyond what is live.
+_live_patterns: WeakValueDictionary[str, Pattern[str]] = WeakValueDictionary()
+
+_REGEX_BACKENDS = ("re", "re2", "pcre2-jit")
+_regex_backend = "re"
+_re2: Any = None
+_re2_options: Any = None
+_pcre2: Any = None
+
+_JSON_BACKENDS = ("json", "simdjson")
+_json_backend = "json"
+_simdjson: Any = None
+_simdjson_parsers = threading.local()
+
+
+def configure(
+    *,
+    regex_backend: str | None = None,
+    json_backend: str | None = None,
+) -> None:
+    """Configure process-wide validation settings.
+
+    Call this once at startup, before decorating functions with ``check()``,
+    which compiles its patterns at decoration time.
+
+    Args:
+        regex_backend: Engine used for string patterns. ``"re"`` (default)
+            uses the standard library. ``"re2"`` uses google-re2
+            (``pip install evalguard[re2]``), which matches in linear time
+            and cannot be driven into catastrophic backtracking by patterns
+            such as ``(a+)+$``. Patterns RE2 does not support
+            (backreferences, lookaround) still compile with ``re``. RE2 also
+            matches differently from ``re``: ``$`` matches only at the very
+            end, not before a trailing newline (``^done$`` rejects
+            ``"done\\n"``), and ``\\d``, ``\\w`` and ``\\s`` are ASCII-only.
+            ``"pcre2-jit"`` uses pcre2 (``pip install evalguard[pcre2]``),
+            which JIT-compiles patterns to machine code and keeps
+            backtracking semantics close to ``re``. Unlike ``re``, PCRE2
+            stops a search that exceeds its match limit (catastrophic
+            backtracking such as ``(a+)+$`` on ``"a" * 40 + "b"``); the
+            check then fails with a ValidationError instead of hanging.
+        json_backend: Validator used by valid_json(). ``"json"`` (default)
+            parses with the standard library. ``"simdjson"`` uses pysimdjson
+            (``pip install evalguard[simdjson]``) to validate with SIMD
+            instructions and without building Python objects; documents it
+            rejects are re-checked with ``json``, so the same inputs pass.
+
+    Raises:
+        ValueError: If the backend name is unknown.
+        ImportError: If the backend's package is not installed.
+
+    """
+    global _regex_backend, _re2, _re2_options, _pcre2, _json_backend, _simdjson
+    if json_backend is not None:
+        if json_backend not in _JSON_BACKENDS:
+            raise ValueError(
+                f"Unknown JSON backend {json_backend!r}, "
+                f"expected one of {_JSON_BACKENDS}"
+            )
+        if json_backend == "simdjson" and _simdjson is None:
+            try:
+                import simdjson  # type: ignore[import-not-found,import-untyped]
+            except ImportError as e:
+                raise ImportError(
+                    "json_backend='simdjson' requires pysimdjson: "
+                    "pip install evalguard[simdjson]"
+                ) from e
+            _simdjson = simdjson
+        _json_backend = json_backend
+    if regex_backend is not None:
+        if regex_backend not in _REGEX_BACKENDS:
+            raise ValueError(
+                f"Unknown regex backend {regex_backend!r}, "
+                f"expected one of {_REGEX_BACKENDS}"
+            )
+        if regex_backend == "re2" and _re2 is None:
+            try:
+                import re2  # type: ignore[import-not-found,import-untyped]
+            except ImportError as e:
+                raise ImportError(
+                    "regex_backend='re2' requires google-re2: "
+                    "pip install evalguard[re2]"
+                ) from e
+            _re2_options = re2.Options()
+            _re2_options.log_errors = False
+            _re2 = re2
+        if regex_backend == "pcre2-jit" and _pcre2 is None:
+            try:
+                import pcre2  # type: ignore[import-not-found,import-untyped]
+            except ImportError as e:
+                raise ImportError(
+                    "regex_backend='pcre2-jit' requires pcre2: "
+                    "pip install evalguard[pcre2]"
+                ) from e
+            _pcre2 = pcre2
+        _regex_backend = regex_backend
+        _compile.cache_clear()
+        _specialize.cache_clear()
+        _live_patterns.clear()
+
+
+# Maps every lone surrogate to U+FFFD, keeping character offsets.
+_SURROGATES = dict.fromkeys(range(0xD800, 0xE000), 0xFFFD)
+
+
+class _MatchAbortedError(Exception):
+    """A backend gave up on a search (e.g. PCRE2's match limit)."""
+
+
+class _BackendPattern:
+    """A pattern compiled by a non-``re`` backend.
+
+    Backends match UTF-8, so text they cannot encode (lone surrogates, which
+    json.loads produces from ``"\\ud800"``) is searched with ``re`` instead,
+    or with surrogates replaced if ``re`` rejects the pattern's syntax.
+    Backend errors raised mid-search (``match_errors``) become
+    _MatchAbortedError, which validators report as a ValidationError.
+    """
+
+    __slots__ = ("__weakref__", "_fallback", "_match_errors", "_search", "pattern")
+
+    def __init__(
+        self,
+        compiled: Any,
+        pattern: str,
+        match_errors: tuple[type[Exception], ...] = (),
+    ) -> None:
+        self.pattern = pattern
+        self._search = compiled.search
+        self._match_errors = match_errors
+        self._fallback: Callable[[str], Any] | None = None
+
+    def search(self, s: str) -> Any:
+        try:
+            return self._search(s)
+        except UnicodeEncodeError:
+            return self._fallback_search(s)
+        except self._match_errors as e:
+            raise _MatchAbortedError(str(e)) from e
+
+    def _fallback_search(self, s: str) -> Any:
+        fallback = self._fallback
+        if fallback is None:
+            try:
+                fallback = re.compile(self.pattern).search
+            except re.error:
+
+                def fallback(t: str) -> Any:
+                    return self.search(t.translate(_SURROGATES))
+
+            self._fallback = fallback
+        return fallback(s)
+
+
+def _match_aborted_error(
+    pattern: str, error: _MatchAbortedError, value: Any, rule: str
+) -> ValidationError:
+    failure = ValidationError(
+        f"Could not match pattern {pattern!r}: {error}",
+        value=value,
+        rule=rule,
+    )
+    failure.__cause__ = error
+    return failure
+
+
+def _compile_with_backend(pattern: str) -> Pattern[str]:
+    if _regex_backend == "re2":
+        try:
+            compiled = _re2.compile(pattern, _re2_options)
+        except _re2.error:
+            pass  # Unsupported by RE2; re reports genuinely invalid patterns.
+        else:
+            return cast("Pattern[str]", _BackendPattern(compiled, pattern))
+    elif _regex_backend == "pcre2-jit":
+        try:
+            compiled = _pcre2.compile(pattern, jit=True)
+        except _pcre2.error:
+            pass  # re-only syntax; re reports genuinely invalid patterns.
+        else:
+            return cast(
+                "Pattern[str]",
+                _BackendPattern(compiled, pattern, (_pcre2.LibraryError,)),
+            )
+    return re.compile(pattern)
+
+
+@lru_cache(maxsize=1024)
+def _compile(pattern: str) -> Pattern[str]:
+    """Compile a regex pattern string, caching the result.
+
+    ``re`` keeps its own cache, but it is small and shared with every other
+    caller in the process. Hot patterns are served from the LRU; patterns it
+    has evicted are still found in ``_live_patterns`` while anything holds
+    them. Invalid patterns raise ``re.error`` and are never cached.
+    """
+    compiled = _live_patterns.get(pattern)
+    if compiled is None:
+        compiled = _compile_with_backend(pattern)
+        _live_patterns[pattern] = compiled
+    return compiled
+
+
+@lru_cache(maxsize=1024)
+def _compile_bytes(pattern: bytes) -> Pattern[bytes]:
+    """Compile a bytes regex pattern, caching the result.
+
+    Kept apart from _compile() so each cache is keyed by a single type.
+    """
+    return re.compile(pattern)
+
+
+_REGEX_META = frozenset(".^$*+?{}[]\\|()")
+_DEFAULT_FLAGS = re.compile("").flags
+
+
+def _is_literal(text: str) -> bool:
+    return not _REGEX_META.intersection(text)
+
+
+def _parse_length_bounds(text: str) -> tuple[int, int | None] | None:
+    """Parse the ``{m}``, ``{m,}`` or ``{m,n}`` part of ``^.{m,n}$``."""
+    if len(text) < 3 or text[0] != "{" or text[-1] != "}":
+        return None
+    low, sep, high = text[1:-1].partition(",")
+    # re only reads ASCII 0-9 as repeat counts; isdigit() alone also
+    # accepts digits such as "²" or "١".
+    if not (low.isascii() and low.isdigit()) or (
+        high and not (high.isascii() and high.isdigit())
+    ):
+        return None
+    if not sep:
+        return int(low), int(low)
+    return int(low), int(high) if high else None
+
+
+@lru_cache(maxsize=1024)
+def _specialize(pattern: str) -> Callable[[str], Any]:
+    """Return a search predicate for a pattern string.
+
+    Trivial patterns (literals, anchored literals, ``.*``, ``.+`` and
+    ``^.{m,n}$``) are answered with plain string operations. Everything else
+    falls back to the compiled pattern's ``search``. Note that ``$`` also
+    matches just before a trailing newline, and ``.`` never matches one.
+    These are ``re`` semantics, so other backends always get the fallback.
+    """
+    if _regex_backend != "re":
+        return _compile(pattern).search
+    if pattern in ("", ".*", ".*?"):
+        return lambda s: True
+    if pattern in (".+", ".+?"):
+        return lambda s: len(s) > s.count("\n")
+
+    anchored_start = pattern.startswith("^")
+    anchored_end = pattern.endswith("$")
+    body = pattern[anchored_start : len(pattern) - anchored_end]
+
+    if _is_literal(body):
+        if anchored_start and anchored_end:
+            with_newline = body + "\n"
+            return lambda s: s == body or s == with_newline
+        if anchored_start:
+            return lambda s: s.startswith(body)
+        if anchored_end:
+            return lambda s: s.endswith((body, body + "\n"))
+        return lambda s: body in s
+
+    if anchored_start and anchored_end and body.startswith("."):
+        bounds = _parse_length_bounds(body[1:])
+        if bounds is not None and (bounds[1] is None or bounds[0] <= bounds[1]):
+            low, high = bounds
+
+            def _length_between(s: str) -> bool:
+                s = s.removesuffix("\n")
+                n = len(s)
+                if n < low or (high is not None and n > high):
+                    return False
+                return "\n" not in s
+
+            return _length_between
+
+    return _compile(pattern).search
+
 
 class ValidationError(Exception):
     """Raised when validation fails.
@@ -40,6 +339,150 @@ class ValidationError(Exception):
         return f"ValidationError({self.message!r}, rule={self.rule!r})"
 
 
+def _stringify(value: Any) -> str:
+    """Return the string form validators operate on (``None`` becomes "")."""
+    if value is None:
+        return ""
+    # Exact type check: str subclasses may override __str__, so they go
+    # through str() like any other object.
+    if type(value) is str:
+        return value
+    return str(value)
+
+
+# Characters a JSON document can start with, including the NaN/Infinity
+# extensions accepted by json.loads and a BOM (which it rejects with its own
+# message).
+_JSON_START = frozenset('{["-0123456789tfnNI\ufeff')
+
+# Integers longer than int()'s digit limit are valid JSON but make json.loads
+# raise a plain ValueError. Such documents are re-parsed with integers left
+# as digit strings; the default decoder stays on the common path, since a
+# Python-level parse_int hook slows every integer down.
+_json_digits_decoder = json.JSONDecoder(parse_int=str)
+
+
+def _decode_json(text: str) -> None:
+    """Parse ``text`` like json.loads, ignoring the int digit limit."""
+    try:
+        json.loads(text)
+    except json.JSONDecodeError:
+        raise
+    except ValueError:
+        _json_digits_decoder.decode(text)
+
+
+def _simdjson_accepts(data: bytes) -> bool:
+    """Return True if simdjson validates ``data``.
+
+    simdjson is stricter than json.loads (no NaN, 64-bit numbers only), so a
+    rejection is never final: callers fall back to the stdlib parser, which
+    keeps the accepted language and error messages unchanged.
+    """
+    parser = getattr(_simdjson_parsers, "parser", None)
+    if parser is None:
+        # Parsers are reusable but not thread-safe.
+        parser = _simdjson_parsers.parser = _simdjson.Parser()
+    try:
+        parser.parse(data)
+    except (ValueError, RuntimeError):
+        return False
+    return True
+
+
+def _validate_json(s: str) -> None:
+    """Validate ``s`` as JSON, rejecting impossible documents up front.
+
+    Raises json.JSONDecodeError exactly as json.loads() would, without
+    entering the parser when the first significant character cannot start
+    a JSON value (prose, markdown, empty output).
+    """
+    stripped = s.lstrip(" \t\n\r")
+    if not stripped or stripped[0] not in _JSON_START:
+        raise json.JSONDecodeError("Expecting value", s, len(s) - len(stripped))
+    # Checked before simdjson, which skips a leading BOM that json.loads
+    # rejects in str input.
+    if s.startswith("\ufeff"):
+        raise json.JSONDecodeError(
+            "Unexpected UTF-8 BOM (decode using utf-8-sig)", s, 0
+        )
+    if _json_backend == "simdjson" and _simdjson_accepts(
+        s.encode("utf-8", "surrogatepass")
+    ):
+        return
+    _decode_json(s)
+
+
+def _not_empty_error(value: Any) -> ValidationError | None:
+    """Return the not_empty() failure for ``value``, or None if it passes."""
+    # Handle None explicitly
+    if value is None:
+        return ValidationError(
+            "Expected non-empty value, got None",
+            value=value,
+            rule="not_empty",
+        )
+    # Handle strings: isspace() stops at the first non-whitespace character
+    # and, unlike strip(), never copies the text.
+    if isinstance(value, str):
+        if not value or value.isspace():
+            return ValidationError(
+                "Expected non-empty value",
+                value=value,
+                rule="not_empty",
+            )
+        return None
+    # Handle anything with a length: check it
+    if isinstance(value, Sized):
+        try:
+            size = len(value)
+        except TypeError:
+            # Sized by type but unsized in practice (e.g. a 0-d numpy
+            # array): fall through to truthiness.
+            pass
+        else:
+            if size == 0:
+                return ValidationError(
+                    f"Expected non-empty {type(value).__name__}",
+                    value=value,
+                    rule="not_empty",
+                )
+            return None
+    # Handle other types: check truthiness
+    if not value:
+        return ValidationError(
+            "Expected non-empty value",
+            value=value,
+            rule="not_empty",
+        )
+    return None
+
+
+def _satisfies_error(
+    value: Any,
+    predicate: Callable[[Any], bool],
+    description: str,
+) -> ValidationError | None:
+    """Return the satisfies() failure for ``value``, or None if it passes."""
+    try:
+        result = predicate(value)
+    except Exception as e:  # noqa: BLE001 - any predicate failure is reported
+        error = ValidationError(
+            f"Predicate '{description}' raised an exception: {e}",
+            value=value,
+            rule="satisfies",
+        )
+        error.__cause__ = e
+        return error
+    if not result:
+        return ValidationError(
+            f"Value did not satisfy {description}",
+            value=value,
+            rule="satisfies",
+        )
+    return None
+
+
 class Expectation:
     """Fluent interface for validating values.
 
@@ -48,16 +491,29 @@ class Expectation:
 
     """
 
-    __slots__ = ("_value", "_str_value")
+    __slots__ = ("_value", "_str_cache")
 
     def __init__(self, value: Any) -> None:
         """Initialize with a value to validate.
 
         Note: For bytes values, str(bytes) gives "b'...'" representation,
-        not the decoded content. Decode bytes before passing if needed.
+        not the decoded content. Decode bytes before passing, or use
+        expect_bytes() to validate them as bytes.
         """
         self._value = value
-        self._str_value = str(value) if value is not None else ""
+        self._str_cache: str | None = None
+
+    @property
+    def _str_value(self) -> str:
+        """String form of the value, computed on first use.
+
+        Checks such as equals(), is_type() and satisfies() never need it, so
+        large non-string values are not converted unless required.
+        """
+        s = self._str_cache
+        if s is None:
+            s = self._str_cache = _stringify(self._value)
+        return s
 
     def contains(self, substring: str) -> Expectation:
         """Assert that the value contains the given substring."""
@@ -83,14 +539,20 @@ class Expectation:
         """Assert that the value matches the given regex pattern."""
         if isinstance(pattern, str):
             try:
-                pattern = re.compile(pattern)
+                pattern = _compile(pattern)
             except re.error as e:
                 raise ValidationError(
                     f"Invalid regex pattern: {e}",
                     value=self._value,
                     rule="matches",
                 ) from e
-        if not pattern.search(self._str_value):
+        try:
+            found = pattern.search(self._str_value)
+        except _MatchAbortedError as e:
+            raise _match_aborted_error(
+                pattern.pattern, e, self._value, "matches"
+            ) from e
+        if not found:
             raise ValidationError(
                 f"Expected value to match pattern {pattern.pattern!r}",
                 value=self._value,
@@ -102,14 +564,20 @@ class Expectation:
         """Assert that the value does not match the given regex pattern."""
         if isinstance(pattern, str):
             try:
-                pattern = re.compile(pattern)
+                pattern = _compile(pattern)
             except re.error as e:
                 raise ValidationError(
                     f"Invalid regex pattern: {e}",
                     value=self._value,
                     rule="not_matches",
                 ) from e
-        if pattern.search(self._str_value):
+        try:
+            found = pattern.search(self._str_value)
+        except _MatchAbortedError as e:
+            raise _match_aborted_error(
+                pattern.pattern, e, self._value, "not_matches"
+            ) from e
+        if found:
             raise ValidationError(
                 f"Expected value to not match pattern {pattern.pattern!r}",
                 value=self._value,
@@ -120,7 +588,7 @@ class Expectation:
     def valid_json(self) -> Expectation:
         """Assert that the value is valid JSON."""
         try:
-            json.loads(self._str_value)
+            _validate_json(self._str_value)
         except (json.JSONDecodeError, TypeError) as e:
             raise ValidationError(
                 f"Expected valid JSON: {e}",
@@ -134,9 +602,10 @@ class Expectation:
 
         Note: For non-string values, this checks len(str(value)), not len(value).
         """
-        if len(self._str_value) > length:
+        n = self._str_length()
+        if n > length:
             raise ValidationError(
-                f"Expected length <= {length}, got {len(self._str_value)}",
+                f"Expected length <= {length}, got {n}",
                 value=self._value,
                 rule="max_length",
             )
@@ -147,9 +616,10 @@ class Expectation:
 
         Note: For non-string values, this checks len(str(value)), not len(value).
         """
-        if len(self._str_value) < length:
+        n = self._str_length()
+        if n < length:
             raise ValidationError(
-                f"Expected length >= {length}, got {len(self._str_value)}",
+                f"Expected length >= {length}, got {n}",
                 value=self._value,
                 rule="min_length",
             )
@@ -159,39 +629,12 @@ class Expectation:
         """Assert that the value is not empty.
 
         For strings: checks that the stripped value is non-empty.
-        For collections (list, dict, set, frozenset, tuple): checks length > 0.
+        For other sized values (collections, bytes, arrays): checks length > 0.
         For other types: checks truthiness.
         """
-        # Handle None explicitly
-        if self._value is None:
-            raise ValidationError(
-                "Expected non-empty value, got None",
-                value=self._value,
-                rule="not_empty",
-            )
-        # Handle strings: check stripped content
-        if isinstance(self._value, str):
-            if not self._value.strip():
-                raise ValidationError(
-                    "Expected non-empty value",
-                    value=self._value,
-                    rule="not_empty",
-                )
-        # Handle collections: check length
-        elif isinstance(self._value, (list, dict, set, frozenset, tuple)):
-            if len(self._value) == 0:
-                raise ValidationError(
-                    f"Expected non-empty {type(self._value).__name__}",
-                    value=self._value,
-                    rule="not_empty",
-                )
-        # Handle other types: check truthiness
-        elif not self._value:
-            raise ValidationError(
-                "Expected non-empty value",
-                value=self._value,
-                rule="not_empty",
-            )
+        error = _not_empty_error(self._value)
+        if error is not None:
+            raise error
         return self
 
     def equals(self, expected: Any) -> Expectation:
@@ -232,27 +675,169 @@ class Expectation:
 
         If the predicate raises an exception, it is wrapped in ValidationError.
         """
+        error = _satisfies_error(self._value, predicate, description)
+        if error is not None:
+            raise error
+        return self
+
+    @property
+    def value(self) -> Any:
+        """Return the wrapped value."""
+        return self._value
+
+    def _str_length(self) -> int:
+        value = self._value
+        if type(value) is str:
+            return len(value)
+        return len(self._str_value)
+
+
+class BytesExpectation:
+    """Fluent interface for validating bytes without decoding them.
+
+    Mirrors Expectation for raw payloads (HTTP bodies, gRPC messages):
+    substrings and patterns are bytes, lengths count bytes, and valid_json()
+    parses the bytes directly (UTF-8, UTF-16 and UTF-32 are detected).
+
+    Example:
+        expect_bytes(body).contains(b"SELECT").not_contains(b"DROP").valid_json()
+
+    """
+
+    __slots__ = ("_value",)
+
+    def __init__(self, value: bytes) -> None:
+        """Initialize with a bytes value to validate."""
+        self._value = value
+
+    def contains(self, substring: bytes) -> BytesExpectation:
+        """Assert that the value contains the given bytes."""
+        if substring not in self._value:
+            raise ValidationError(
+                f"Expected value to contain {substring!r}",
+                value=self._value,
+                rule="contains",
+            )
+        return self
+
+    def not_contains(self, substring: bytes) -> BytesExpectation:
+        """Assert that the value does not contain the given bytes."""
+        if substring in self._value:
+            raise ValidationError(
+                f"Expected value to not contain {substring!r}",
+                value=self._value,
+                rule="not_contains",
+            )
+        return self
+
+    def matches(self, pattern: bytes | Pattern[bytes]) -> BytesExpectation:
+        """Assert that the value matches the given bytes regex pattern."""
+        pattern = self._compile(pattern, "matches")
+        if not pattern.search(self._value):
+            raise ValidationError(
+                f"Expected value to match pattern {pattern.pattern!r}",
+                value=self._value,
+                rule="matches",
+            )
+        return self
+
+    def not_matches(self, pattern: bytes | Pattern[bytes]) -> BytesExpectation:
+        """Assert that the value does not match the given bytes regex pattern."""
+        pattern = self._compile(pattern, "not_matches")
+        if pattern.search(self._value):
+            raise ValidationError(
+                f"Expected value to not match pattern {pattern.pattern!r}",
+                value=self._value,
+                rule="not_matches",
+            )
+        return self
+
+    def valid_json(self) -> BytesExpectation:
+        """Assert that the value is valid JSON."""
+        if _json_backend == "simdjson" and _simdjson_accepts(self._value):
+            return self
         try:
-            result = predicate(self._value)
-        except Exception as e:
+            data = self._value
+            _decode_json(data.decode(json.detect_encoding(data), "surrogatepass"))
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
             raise ValidationError(
-                f"Predicate '{description}' raised an exception: {e}",
+                f"Expected valid JSON: {e}",
                 value=self._value,
-                rule="satisfies",
+                rule="valid_json",
             ) from e
-        if not result:
+        return self
+
+    def max_length(self, length: int) -> BytesExpectation:
+        """Assert that the value is at most the given number of bytes."""
+        if len(self._value) > length:
+            raise ValidationError(
+                f"Expected length <= {length}, got {len(self._value)}",
+                value=self._value,
+                rule="max_length",
+            )
+        return self
+
+    def min_length(self, length: int) -> BytesExpectation:
+        """Assert that the value is at least the given number of bytes."""
+        if len(self._value) < length:
+            raise ValidationError(
+                f"Expected length >= {length}, got {len(self._value)}",
+                value=self._value,
+                rule="min_length",
+            )
+        return self
+
+    def not_empty(self) -> BytesExpectation:
+        """Assert that the value is not empty or only ASCII whitespace."""
+        if not self._value or self._value.isspace():
             raise ValidationError(
-                f"Value did not satisfy {description}",
+                "Expected non-empty value",
                 value=self._value,
-                rule="satisfies",
+                rule="not_empty",
             )
         return self
 
+    def equals(self, expected: Any) -> BytesExpectation:
+        """Assert that the value equals the expected value."""
+        if self._value != expected:
+            raise ValidationError(
+                f"Expected {expected!r}, got {self._value!r}",
+                value=self._value,
+                rule="equals",
+            )
+        return self
+
+    def satisfies(
+        self,
+        predicate: Callable[[bytes], bool],
+        description: str = "custom predicate",
+    ) -> BytesExpectation:
+        """Assert that the value satisfies the given predicate.
+
+        If the predicate raises an exception, it is wrapped in ValidationError.
+        """
+        error = _satisfies_error(self._value, predicate, description)
+        if error is not None:
+            raise error
+        return self
+
     @property
-    def value(self) -> Any:
+    def value(self) -> bytes:
         """Return the wrapped value."""
         return self._value
 
+    def _compile(self, pattern: bytes | Pattern[bytes], rule: str) -> Pattern[bytes]:
+        if isinstance(pattern, bytes):
+            try:
+                return _compile_bytes(pattern)
+            except re.error as e:
+                raise ValidationError(
+                    f"Invalid regex pattern: {e}",
+                    value=self._value,
+                    rule=rule,
+                ) from e
+        return pattern
+
 
 def expect(value: Any) -> Expectation:
     """Create an expectation for fluent validation.
@@ -270,6 +855,310 @@ def expect(value: Any) -> Expectation:
     return Expectation(value)
 
 
+def expect_bytes(value: bytes) -> BytesExpectation:
+    """Create an expectation that validates bytes without decoding them.
+
+    Example:
+        expect_bytes(response.content).valid_json().not_contains(b"error")
+
+    Args:
+        value: The bytes to validate.
+
+    Returns:
+        A BytesExpectation object for chaining validations.
+
+    """
+    return BytesExpectation(value)
+
+
+# A configured check(): receives the result and its string form, returns the
+# ValidationError describing the failure (unraised) or None.
+_Check = Callable[[Any, str], "ValidationError | None"]
+
+
+def _normalize_patterns(
+    patterns: str | Pattern[str] | list[str | Pattern[str]] | None,
+    rule: str,
+) -> tuple[tuple[str, Callable[[str], Any]], ...]:
+    """Resolve ``check()`` pattern arguments into ``(pattern, search)`` pairs."""
+    if not patterns:
+        return ()
+    # A single pattern: a string, or any compiled object (re, google-re2).
+    if isinstance(patterns, str) or hasattr(patterns, "search"):
+        patterns = [patterns]  # type: ignore[list-item]
+    resolved = []
+    for p in patterns:
+        if isinstance(p, str):
+            try:
+                search = _specialize(p)
+            except re.error as e:
+                raise ValidationError(
+                    f"Invalid regex pattern: {e}",
+                    rule=rule,
+                ) from e
+            resolved.append((p, search))
+        elif (
+            # Only stdlib patterns have .flags: google-re2 objects do not.
+            _regex_backend == "re"
+            and isinstance(p, Pattern)
+            and isinstance(p.pattern, str)
+            and p.flags == _DEFAULT_FLAGS
+        ):
+            resolved.append((p.pattern, _specialize(p.pattern)))
+        else:
+            resolved.append((p.pattern, p.search))
+    return tuple(resolved)
+
+
+def _freeze_needles(needles: list[str]) -> tuple[str, ...]:
+    """Deduplicate and intern ``check()`` substrings, keeping their order."""
+    return tuple(dict.fromkeys(sys.intern(s) if type(s) is str else s for s in needles))
+
+
+def _not_empty_check(result: Any, s: str) -> ValidationError | None:
+    return _not_empty_error(result)
+
+
+# Needle tuples up to this size get a generated check with one ``in`` test
+# per needle instead of a loop; longer tuples keep the loop.
+_UNROLL_MAX = 8
+
+
+def _can_unroll(needles: tuple[str, ...]) -> bool:
+    # Generated checks are cached by needle tuple, so only exact str needles
+    # qualify: an equal str subclass needle must not share another's check.
+    return len(needles) <= _UNROLL_MAX and all(type(n) is str for n in needles)
+
+
+@lru_cache(maxsize=1024)
+def _unroll_needles(
+    needles: tuple[str, ...], test: str, verb: str, rule: str
+) -> _Check:
+    """Generate a straight-line check testing each needle with ``test``.
+
+    Cached, so the exec cost is paid once per distinct needle tuple rather
+    than on every ``check()`` decoration or ``check_many()`` call.
+    """
+    ns: dict[str, Any] = {"ValidationError": ValidationError}
+    lines = ["def _check(result, s):"]
+    for i, sub in enumerate(needles):
+        ns[f"_n{i}"] = sub
+        ns[f"_m{i}"] = f"Expected value to {verb} {sub!r}"
+        lines.append(f"    if _n{i} {test} s:")
+        lines.append(
+            f"        return ValidationError(_m{i}, value=result, rule={rule!r})"
+        )
+    lines.append("    return None")
+    exec("\n".join(lines), ns)  # noqa: S102 - source built from fixed template
+    check_fn: _Check = ns["_check"]
+    check_fn.__name__ = check_fn.__qualname__ = f"_{rule}"
+    return check_fn
+
+
+def _make_contains_check(needles: tuple[str, ...]) -> _Check:
+    if _can_unroll(needles):
+        return _unroll_needles(needles, "not in", "contain", "contains")
+
+    def _contains(result: Any, s: str) -> ValidationError | None:
+        for sub in needles:
+            if sub not in s:
+                return ValidationError(
+                    f"Expected value to contain {sub!r}",
+                    value=result,
+                    rule="contains",
+                )
+        return None
+
+    return _contains
+
+
+def _make_not_contains_check(needles: tuple[str, ...]) -> _Check:
+    if _can_unroll(needles):
+        return _unroll_needles(needles, "in", "not contain", "not_contains")
+
+    def _not_contains(result: Any, s: str) -> ValidationError | None:
+        for sub in needles:
+            if sub in s:
+                return ValidationError(
+                    f"Expected value to not contain {sub!r}",
+                    value=result,
+                    rule="not_contains",
+                )
+        return None
+
+    return _not_contains
+
+
+def _make_matches_check(
+    patterns: tuple[tuple[str, Callable[[str], Any]], ...],
+) -> _Check:
+    def _matches(result: Any, s: str) -> ValidationError | None:
+        for pattern, search in patterns:
+            try:
+                found = search(s)
+            except _MatchAbortedError as e:
+                return _match_aborted_error(pattern, e, result, "matches")
+            if not found:
+                return ValidationError(
+                    f"Expected value to match pattern {pattern!r}",
+                    value=result,
+                    rule="matches",
+                )
+        return None
+
+    return _matches
+
+
+def _fuse_patterns(
+    patterns: tuple[tuple[str, Callable[[str], Any]], ...],
+) -> Callable[[str], Any] | None:
+    """Combine RE2-compiled patterns into one alternation, if possible.
+
+    RE2 scans an alternation in a single linear pass, several times faster
+    than searching each pattern in turn. With ``re`` the alternation is slower
+    (each pattern loses its own prefix scan), so only RE2 patterns are fused.
+    """
+    if _regex_backend != "re2" or len(patterns) < 2:
+        return None
+    for _, search in patterns:
+        owner = getattr(search, "__self__", None)
+        if owner is None or isinstance(owner, Pattern):
+            return None
+    alternation = "|".join(f"(?:{pattern})" for pattern, _ in patterns)
+    try:
+        compiled = _re2.compile(alternation, _re2_options)
+    except _re2.error:
+        return None
+    return _BackendPattern(compiled, alternation).search
+
+
+def _make_not_matches_check(
+    patterns: tuple[tuple[str, Callable[[str], Any]], ...],
+) -> _Check:
+    fused = _fuse_patterns(patterns)
+
+    def _not_matches(result: Any, s: str) -> ValidationError | None:
+        # One pass answers "none match"; on a hit, find the first offender.
+        if fused is not None and not fused(s):
+            return None
+        for pattern, search in patterns:
+            try:
+                found = search(s)
+            except _MatchAbortedError as e:
+                return _match_aborted_error(pattern, e, result, "not_matches")
+            if found:
+                return ValidationError(
+                    f"Expected value to not match pattern {pattern!r}",
+                    value=result,
+                    rule="not_matches",
+                )
+        return None
+
+    return _not_matches
+
+
+def _valid_json_check(result: Any, s: str) -> ValidationError | None:
+    try:
+        _validate_json(s)
+    except (json.JSONDecodeError, TypeError) as e:
+        error = ValidationError(
+            f"Expected valid JSON: {e}",
+            value=result,
+            rule="valid_json",
+        )
+        error.__cause__ = e
+        return error
+    return None
+
+
+def _make_max_length_check(length: int) -> _Check:
+    def _max_length(result: Any, s: str) -> ValidationError | None:
+        if len(s) > length:
+            return ValidationError(
+                f"Expected length <= {length}, got {len(s)}",
+                value=result,
+                rule="max_length",
+            )
+        return None
+
+    return _max_length
+
+
+def _make_min_length_check(length: int) -> _Check:
+    def _min_length(result: Any, s: str) -> ValidationError | None:
+        if len(s) < length:
+            return ValidationError(
+                f"Expected length >= {length}, got {len(s)}",
+                value=result,
+                rule="min_length",
+            )
+        return None
+
+    return _min_length
+
+
+def _make_satisfies_check(predicate: Callable[[Any], bool]) -> _Check:
+    def _satisfies(result: Any, s: str) -> ValidationError | None:
+        return _satisfies_error(result, predicate, "custom check")
+
+    return _satisfies
+
+
+def _build_checks(
+    *,
+    contains: list[str] | None = None,
+    not_contains: list[str] | None = None,
+    matches: str | Pattern[str] | list[str | Pattern[str]] | None = None,
+    not_matches: str | Pattern[str] | list[str | Pattern[str]] | None = None,
+    valid_json: bool = False,
+    max_length: int | None = None,
+    min_length: int | None = None,
+    not_empty: bool = False,
+    satisfies: Callable[[Any], bool] | None = None,
+) -> tuple[tuple[_Check, ...], bool]:
+    """Resolve check() rules into ordered checks.
+
+    Returns the checks and whether any of them needs the string form of the
+    value.
+    """
+    # Only the configured checks are kept, in a fixed order, so the wrapper
+    # does no per-call dispatch on unused options.
+    checks: list[_Check] = []
+    if not_empty:
+        checks.append(_not_empty_check)
+    # One `in` scan per distinct needle. CPython's substring search beats both
+    # a combined regex alternation and pyahocorasick unless there are dozens
+    # of needles, so duplicates are the only scans to save.
+    if contains:
+        checks.append(_make_contains_check(_freeze_needles(contains)))
+    if not_contains:
+        checks.append(_make_not_contains_check(_freeze_needles(not_contains)))
+    if matches:
+        checks.append(_make_matches_check(_normalize_patterns(matches, "matches")))
+    if not_matches:
+        checks.append(
+            _make_not_matches_check(_normalize_patterns(not_matches, "not_matches"))
+        )
+    if valid_json:
+        checks.append(_valid_json_check)
+    if max_length is not None:
+        checks.append(_make_max_length_check(max_length))
+    if min_length is not None:
+        checks.append(_make_min_length_check(min_length))
+    if satisfies is not None:
+        checks.append(_make_satisfies_check(satisfies))
+    needs_str = bool(
+        contains
+        or not_contains
+        or matches
+        or not_matches
+        or valid_json
+        or max_length is not None
+        or min_length is not None
+    )
+    return tuple(checks), needs_str
+
+
 def check(
     *,
     contains: list[str] | None = None,
@@ -282,6 +1171,7 @@ def check(
     not_empty: bool = False,
     satisfies: Callable[[Any], bool] | None = None,
     on_fail: Callable[[ValidationError], Any] | None = None,
+    assume: dict[str, Any] | None = None,
 ) -> Callable[[Callable[..., T]], Callable[..., T]]:
     """Validate function return values with a decorator.
 
@@ -303,9 +1193,14 @@ def check(
         on_fail: Optional callback on validation failure. If provided and returns
                  a non-None value, that value is returned instead of raising.
                  If it returns None, None is returned (not the original result).
+        assume: Rules the function is known to satisfy, keyed like the
+                arguments above (e.g. ``{"contains": ["result"]}``). They are
+                verified until one call passes them, then no longer checked.
 
     Raises:
         ValidationError: If any validation fails (unless on_fail handles it).
+            Invalid regex patterns are reported when the function is
+            decorated, not when it is called.
 
     Note:
         This decorator does not support async functions. For async code,
@@ -313,60 +1208,155 @@ def check(
 
     """
 
+    _checks, _needs_str = _build_checks(
+        contains=contains,
+        not_contains=not_contains,
+        matches=matches,
+        not_matches=not_matches,
+        valid_json=valid_json,
+        max_length=max_length,
+        min_length=min_length,
+        not_empty=not_empty,
+        satisfies=satisfies,
+    )
+
+    _assumed, _assumed_need_str = _build_checks(**(assume or {}))
+
     def decorator(fn: Callable[..., T]) -> Callable[..., T]:
+        # Assumed checks still to verify for this function.
+        unverified = _assumed
+
         @wraps(fn)
         def wrapper(*args: Any, **kwargs: Any) -> T:
+            nonlocal unverified
             result = fn(*args, **kwargs)
+            checks = _checks
+            needs_str = _needs_str
+            verifying = unverified
+            if verifying:
+                checks = verifying + checks
+                needs_str = needs_str or _assumed_need_str
+            s = _stringify(result) if needs_str else ""
+
+            # Failures are returned rather than raised, so an on_fail handler
+            # receives the error without a raise/catch round trip.
+            for c in checks:
+                error = c(result, s)
+                if error is not None:
+                    if on_fail is not None:
+                        return on_fail(error)
+                    raise error
+
+            if verifying:
+                unverified = ()
+            return result
 
-            try:
-                exp = expect(result)
+        return wrapper
 
-                if not_empty:
-                    exp.not_empty()
+    return decorator
 
-                if contains:
-                    for s in contains:
-                        exp.contains(s)
 
-                if not_contains:
-                    for s in not_contains:
-                        exp.not_contains(s)
+def check_many(
+    results: Iterable[Any],
+    *,
+    contains: list[str] | None = None,
+    not_contains: list[str] | None = None,
+    matches: str | Pattern[str] | list[str | Pattern[str]] | None = None,
+    not_matches: str | Pattern[str] | list[str | Pattern[str]] | None = None,
+    valid_json: bool = False,
+    max_length: int | None = None,
+    min_length: int | None = None,
+    not_empty: bool = False,
+    satisfies: Callable[[Any], bool] | None = None,
+) -> list[bool]:
+    """Validate a batch of values against the same rules.
 
-                if matches:
-                    if isinstance(matches, (str, Pattern)):
-                        patterns = [matches]
-                    else:
-                        patterns = matches
-                    for p in patterns:
-                        exp.matches(p)
+    Rules are resolved once for the whole batch, which makes this the
+    cheapest way to score an agent over a test set.
 
-                if not_matches:
-                    if isinstance(not_matches, (str, Pattern)):
-                        patterns = [not_matches]
-                    else:
-                        patterns = not_matches
-                    for p in patterns:
-                        exp.not_matches(p)
+    Example:
+        passed = check_many(outputs, contains=["SELECT"], not_contains=["DROP"])
+        accuracy = sum(passed) / len(passed)
 
-                if valid_json:
-                    exp.valid_json()
+    Args:
+        results: Values to validate.
+        contains, not_contains, matches, not_matches, valid_json, max_length,
+        min_length, not_empty, satisfies: Same rules as check().
 
-                if max_length is not None:
-                    exp.max_length(max_length)
+    Returns:
+        One bool per value, True where every rule passed.
 
-                if min_length is not None:
-                    exp.min_length(min_length)
+    Raises:
+        ValidationError: If a regex pattern is invalid.
 
-                if satisfies is not None:
-                    exp.satisfies(satisfies, "custom check")
+    """
+    errors = check_batch(
+        results,
+        contains=contains,
+        not_contains=not_contains,
+        matches=matches,
+        not_matches=not_matches,
+        valid_json=valid_json,
+        max_length=max_length,
+        min_length=min_length,
+        not_empty=not_empty,
+        satisfies=satisfies,
+    )
+    return [error is None for error in errors]
+
+
+def check_batch(
+    results: Iterable[Any],
+    *,
+    contains: list[str] | None = None,
+    not_contains: list[str] | None = None,
+    matches: str | Pattern[str] | list[str | Pattern[str]] | None = None,
+    not_matches: str | Pattern[str] | list[str | Pattern[str]] | None = None,
+    valid_json: bool = False,
+    max_length: int | None = None,
+    min_length: int | None = None,
+    not_empty: bool = False,
+    satisfies: Callable[[Any], bool] | None = None,
+) -> list[ValidationError | None]:
+    """Validate a batch of values, reporting why each failure failed.
 
-            except ValidationError as e:
-                if on_fail is not None:
-                    return on_fail(e)
-                raise
+    Like check_many(), but returns the ValidationError that check() would
+    have raised for each value (none of them are raised).
 
-            return result
+    Example:
+        errors = check_batch(outputs, valid_json=True, max_length=4096)
+        failures = [(o, e.rule) for o, e in zip(outputs, errors) if e]
 
-        return wrapper
+    Args:
+        results: Values to validate.
+        contains, not_contains, matches, not_matches, valid_json, max_length,
+        min_length, not_empty, satisfies: Same rules as check().
 
-    return decorator
+    Returns:
+        One entry per value: the first failed rule's ValidationError, or None.
+
+    Raises:
+        ValidationError: If a regex pattern is invalid.
+
+    """
+    checks, needs_str = _build_checks(
+        contains=contains,
+        not_contains=not_contains,
+        matches=matches,
+        not_matches=not_matches,
+        valid_json=valid_json,
+        max_length=max_length,
+        min_length=min_length,
+        not_empty=not_empty,
+        satisfies=satisfies,
+    )
+    errors = []
+    for result in results:
+        s = _stringify(result) if needs_str else ""
+        error = None
+        for c in checks:
+            error = c(result, s)
+            if error is not None:
+                break
+        errors.append(error)
+    return errors
@@ -0,0 +1,27 @@
+"""Shared fixtures for evalguard tests."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from evalguard import expect
+from evalguard.core import _compile, _specialize
+
+# Pattern strings shared by many tests.
+_WARM_PATTERNS = [r"user_\d+", r"\d+", r"^\d{4}-\d{2}-\d{2}$", r"SELECT", r"FROM"]
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_caches():
+    """Compile the suite's common patterns once before the first test runs."""
+    for pattern in _WARM_PATTERNS:
+        _compile(pattern)
+        _specialize(pattern)
+    expect("warm").contains("warm").not_contains("cold")
+
+
+@pytest.fixture(scope="session")
+def thread_pool():
+    """One pool of worker threads reused by every concurrency test."""
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        yield executor
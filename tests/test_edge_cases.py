@@ -1,7 +1,7 @@
 """Edge case tests for evalguard."""
 
 import pytest
-from evalguard import check, expect, ValidationError
+from evalguard import check, expect, expect_bytes, ValidationError
 
 
 class TestEdgeCases:
@@ -12,6 +12,18 @@ class TestEdgeCases:
         with pytest.raises(ValidationError):
             expect("").not_empty()
 
+    def test_unicode_whitespace_not_empty(self):
+        """Test that not_empty treats Unicode whitespace like str.strip()."""
+        for blank in ["\u3000", " \t\n\r\x0b\x0c", "\u2028\xa0"]:
+            with pytest.raises(ValidationError):
+                expect(blank).not_empty()
+        expect("\u200b").not_empty()  # zero-width space is not whitespace
+        expect("  text\n").not_empty()
+
+        with pytest.raises(ValidationError):
+            expect_bytes(b" \t\n\r\x0b\x0c").not_empty()
+        expect_bytes(b"\xa0").not_empty()
+
     def test_none_value(self):
         """Test validation on None - converts to empty string."""
         # None becomes "" for string comparisons
@@ -189,3 +201,352 @@ class TestEdgeCases:
             return "SELECT * FROM users"
 
         assert safe_query() == "SELECT * FROM users"
+
+    def test_pattern_string_compiled_once(self):
+        """Test that repeated string patterns reuse one compiled Pattern."""
+        from evalguard.core import _compile
+
+        pattern = r"cached_\d+_pattern"
+        expect("cached_1_pattern").matches(pattern)
+        expect("cached").not_matches(pattern)
+        assert _compile(pattern) is _compile(pattern)
+
+    def test_invalid_regex_not_cached(self):
+        """Test that invalid patterns keep failing and are not cached."""
+        from evalguard.core import _compile
+
+        before = _compile.cache_info().currsize
+        for _ in range(2):
+            with pytest.raises(ValidationError):
+                expect("test").matches("[still invalid")
+        assert _compile.cache_info().currsize == before
+
+    def test_check_invalid_regex_fails_at_decoration(self):
+        """Test that @check reports invalid regex when decorating."""
+        with pytest.raises(ValidationError) as exc:
+            check(matches="[invalid")(lambda: "anything")
+        assert exc.value.rule == "matches"
+
+        with pytest.raises(ValidationError) as exc:
+            check(not_matches=["ok", "(unclosed"])(lambda: "anything")
+        assert exc.value.rule == "not_matches"
+
+    def test_check_matches_reports_pattern(self):
+        """Test that @check match failures name the failing pattern."""
+        @check(matches=[r"SELECT", r"WHERE"])
+        def query():
+            return "SELECT * FROM users"
+
+        with pytest.raises(ValidationError) as exc:
+            query()
+        assert exc.value.rule == "matches"
+        assert "WHERE" in exc.value.message
+        assert exc.value.value == "SELECT * FROM users"
+
+    def test_check_trivial_patterns_match_re_semantics(self):
+        """Test that fast paths for trivial patterns agree with re.search."""
+        import re
+        patterns = [
+            ".*", ".+", "^", "^$", "SELECT", "^SELECT", "users$",
+            "^SELECT$", "^.{2}$", "^.{1,3}$", "^.{2,}$",
+            # Non-ASCII digits are literal text to re, not repeat counts
+            "^.{\u00b2}$", "^.{\u0661}$", "^.{1,\u0661}$",
+        ]
+        values = ["", "\n", "ab", "ab\n", "a\nb", "abcd", "SELECT",
+                  "SELECT\n", "xSELECT", "from users", "users\n\n"]
+        for pattern in patterns:
+            for value in values:
+                @check(matches=pattern, on_fail=lambda e: "failed")
+                def func(value=value):
+                    return value
+
+                expected = value if re.search(pattern, value) else "failed"
+                assert func() == expected, (pattern, value)
+
+    def test_check_compiled_pattern_flags_respected(self):
+        """Test that compiled patterns with flags keep their semantics."""
+        import re
+
+        @check(matches=re.compile("select", re.IGNORECASE))
+        def query():
+            return "SELECT * FROM users"
+
+        assert query() == "SELECT * FROM users"
+
+    def test_check_non_string_result(self):
+        """Test that @check validates str(result) for non-string results."""
+        @check(contains=["'key'"], max_length=20, valid_json=False)
+        def returns_dict():
+            return {"key": 1}
+
+        assert returns_dict() == {"key": 1}
+
+        @check(contains=["anything"])
+        def returns_none():
+            return None
+
+        with pytest.raises(ValidationError) as exc:
+            returns_none()
+        assert exc.value.rule == "contains"
+        assert exc.value.value is None
+
+    def test_str_conversion_is_lazy(self):
+        """Test that str(value) is computed only when a check needs it."""
+        class Tracked:
+            calls = 0
+
+            def __str__(self):
+                Tracked.calls += 1
+                return "tracked value"
+
+        value = Tracked()
+        expect(value).equals(value).is_type(Tracked).satisfies(bool)
+        assert Tracked.calls == 0
+
+        expect(value).contains("tracked").not_contains("other").max_length(20)
+        assert Tracked.calls == 1
+
+    def test_valid_json_rejects_prose_like_json_loads(self):
+        """Test that the early reject reports the same error as json.loads."""
+        import json
+        for text in ["", "   ", "Sure! Here is the JSON", "```json\n{}\n```",
+                     "\ufeff{}", "[1,]"]:
+            with pytest.raises(json.JSONDecodeError) as expected:
+                json.loads(text)
+            with pytest.raises(ValidationError) as exc:
+                expect(text).valid_json()
+            assert exc.value.message == f"Expected valid JSON: {expected.value}"
+            assert isinstance(exc.value.__cause__, json.JSONDecodeError)
+
+    def test_valid_json_accepts_all_json_loads_literals(self):
+        """Test that every value json.loads accepts still passes."""
+        for text in ['"s"', "-1", "0.5", "true", "false", "null", "NaN",
+                     "Infinity", "-Infinity", ' \n\t{"a": [1]}']:
+            expect(text).valid_json()
+
+    def test_evicted_pattern_reused_while_live(self):
+        """Test that a pattern evicted from the LRU is not recompiled."""
+        import re
+        from evalguard.core import _compile
+
+        held = _compile(r"live_\d+_pattern")
+        _compile.cache_clear()
+        re.purge()
+        assert _compile(r"live_\d+_pattern") is held
+
+    def test_not_empty_any_sized(self):
+        """Test not_empty uses len() for any sized value."""
+        from collections import deque
+
+        for empty in (deque(), bytearray(), b"", range(0)):
+            with pytest.raises(ValidationError) as exc:
+                expect(empty).not_empty()
+            assert type(empty).__name__ in exc.value.message
+
+        expect(deque([1])).not_empty()
+        expect(b"data").not_empty()
+
+    def test_not_empty_unsized_len(self):
+        """Test that a __len__ raising TypeError falls back to truthiness."""
+        class Scalar:
+            """Like a 0-d numpy array: has __len__ but no length."""
+
+            def __init__(self, value):
+                self.value = value
+
+            def __len__(self):
+                raise TypeError("len() of unsized object")
+
+            def __bool__(self):
+                return bool(self.value)
+
+        expect(Scalar(3)).not_empty()
+        with pytest.raises(ValidationError) as exc:
+            expect(Scalar(0)).not_empty()
+        assert exc.value.rule == "not_empty"
+
+        @check(not_empty=True)
+        def func():
+            return Scalar(1)
+
+        assert func().value == 1
+
+    def test_check_duplicate_needles(self):
+        """Test that repeated needles behave like a single needle."""
+        @check(contains=["a", "b", "a"], not_contains=["x", "y", "x"])
+        def func():
+            return "ab"
+
+        assert func() == "ab"
+
+        @check(not_contains=["z", "y", "z", "y"])
+        def bad():
+            return "zy"
+
+        with pytest.raises(ValidationError) as exc:
+            bad()
+        assert "'z'" in exc.value.message
+
+    def test_expectations_have_no_instance_dict(self):
+        """Test that expectations stay slotted and allocate no __dict__."""
+        assert not hasattr(expect("x"), "__dict__")
+        assert not hasattr(expect_bytes(b"x"), "__dict__")
+
+    def test_check_short_and_long_needle_lists(self):
+        """Test unrolled and looped needle checks report the same needle."""
+        for count in (1, 8, 9, 20):
+            needles = [f"tok{i}_" for i in range(count)]
+
+            @check(contains=needles)
+            def has_all(needles=needles):
+                return "".join(needles[:-1])
+
+            @check(not_contains=needles)
+            def has_none(needles=needles):
+                return needles[-1]
+
+            with pytest.raises(ValidationError) as exc:
+                has_all()
+            assert exc.value.rule == "contains"
+            assert repr(needles[-1]) in exc.value.message
+
+            with pytest.raises(ValidationError) as exc:
+                has_none()
+            assert exc.value.rule == "not_contains"
+            assert repr(needles[-1]) in exc.value.message
+
+    def test_check_many_reuses_generated_needle_checks(self):
+        """Test that resolving the same needles again skips code generation."""
+        from evalguard import check_many
+        from evalguard.core import _unroll_needles
+
+        rules = {"contains": ["SELECT"], "not_contains": ["DROP", "DELETE"]}
+        check_many(["SELECT 1"], **rules)
+        misses = _unroll_needles.cache_info().misses
+        for _ in range(3):
+            assert check_many(["SELECT 1", "DROP"], **rules) == [True, False]
+        assert _unroll_needles.cache_info().misses == misses
+
+    def test_str_subclass_uses_its_str(self):
+        """Test that str subclasses are validated through their __str__."""
+        class Redacted(str):
+            def __str__(self):
+                return "[redacted]"
+
+        value = Redacted("secret")
+        expect(value).contains("[redacted]").not_contains("secret")
+
+        @check(not_contains=["secret"])
+        def func():
+            return value
+
+        assert func() is value
+
+    def test_check_str_subclass_needles(self):
+        """Test that needles which cannot be interned still work."""
+        class Needle(str):
+            pass
+
+        @check(contains=[Needle("SELECT")], not_contains=[Needle("DROP")])
+        def query():
+            return "SELECT 1"
+
+        assert query() == "SELECT 1"
+
+    def test_check_wrapper_introspection(self):
+        """Test that decorated functions keep name, module, signature and hints."""
+        import inspect
+        import typing
+
+        def query(text: str, limit: int = 10) -> str:
+            return text
+
+        query.tool_name = "sql"
+        wrapped = check(not_empty=True)(query)
+        assert wrapped.__wrapped__ is query
+        assert wrapped.__module__ == query.__module__
+        assert wrapped.__qualname__ == query.__qualname__
+        assert inspect.signature(wrapped) == inspect.signature(query)
+        # Tool frameworks read type hints and attributes off the wrapper
+        assert typing.get_type_hints(wrapped) == typing.get_type_hints(query)
+        assert wrapped.tool_name == "sql"
+
+    def test_length_of_non_string_uses_str_form(self):
+        """Test that lengths of non-strings keep counting len(str(value))."""
+        expect([1, 2, 3]).max_length(9).min_length(9)
+        with pytest.raises(ValidationError, match="got 9"):
+            expect([1, 2, 3]).max_length(3)
+        expect(b"ab").min_length(5)  # "b'ab'"
+
+    def test_on_fail_receives_unraised_error(self):
+        """Test that on_fail gets a complete error that was never raised."""
+        errors = []
+
+        @check(valid_json=True, on_fail=errors.append)
+        def bad_json():
+            return "not json"
+
+        assert bad_json() is None
+        (error,) = errors
+        assert error.rule == "valid_json"
+        assert error.value == "not json"
+        assert error.__traceback__ is None
+        assert isinstance(error.__cause__, ValueError)
+
+    def test_check_raised_error_keeps_cause(self):
+        """Test that errors raised by @check still chain their cause."""
+        def explode(value):
+            raise KeyError("boom")
+
+        @check(satisfies=explode)
+        def func():
+            return "value"
+
+        with pytest.raises(ValidationError) as exc:
+            func()
+        assert "raised an exception" in exc.value.message
+        assert isinstance(exc.value.__cause__, KeyError)
+
+    def test_check_compiles_patterns_once(self):
+        """Test that decorated calls never go back to the compile cache."""
+        from evalguard.core import _compile, _specialize
+
+        rules = {"matches": r"^r\d+_\d+$", "not_matches": [r"err(or)?\b"]}
+        funcs = [check(**rules)(lambda i=i: f"r{i}_{i}") for i in range(5)]
+        compile_calls = _compile.cache_info()
+        specialize_calls = _specialize.cache_info()
+
+        for _ in range(100):
+            for func in funcs:
+                func()
+
+        assert _compile.cache_info() == compile_calls
+        assert _specialize.cache_info() == specialize_calls
+
+    def test_valid_json_huge_integer(self):
+        """Test that integers beyond int()'s digit limit are still valid JSON."""
+        expect("[" + "7" * 5000 + "]").valid_json()
+        expect_bytes(b'{"n": ' + b"9" * 5000 + b"}").valid_json()
+
+        # The digit-limit retry still reports real syntax errors
+        with pytest.raises(ValidationError) as exc:
+            expect("[" + "7" * 5000 + ",]").valid_json()
+        assert exc.value.rule == "valid_json"
+        with pytest.raises(ValidationError):
+            expect_bytes(b"[" + b"9" * 5000 + b",]").valid_json()
+
+    def test_check_overlapping_needles(self):
+        """Test needles that overlap or nest inside each other."""
+        @check(contains=["ab", "b", "bc"], not_contains=["abd", "cb"])
+        def func():
+            return "abc"
+
+        assert func() == "abc"
+
+        @check(not_contains=["DROP TABLE", "DROP", "TABLE"])
+        def dangerous():
+            return "DROP TABLE users"
+
+        with pytest.raises(ValidationError) as exc:
+            dangerous()
+        assert "'DROP TABLE'" in exc.value.message
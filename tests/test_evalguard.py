@@ -1,8 +1,39 @@
 """Tests for evalguard."""
 
+import re
+
 import pytest
 
-from evalguard import check, expect, ValidationError
+from evalguard import (
+    check,
+    check_batch,
+    check_many,
+    configure,
+    expect,
+    expect_bytes,
+    ValidationError,
+)
+
+_USER_RE = re.compile(r"user_\d+")
+_DIGIT_RE = re.compile(r"\d+")
+_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+_SELECT_RE = re.compile(r"SELECT")
+_FROM_RE = re.compile(r"FROM")
+
+# pytest.raises(match=...) patterns
+_M_CONTAIN = re.compile("contain")
+_M_NOT_CONTAIN = re.compile("not contain")
+_M_LENGTH = re.compile("length")
+_M_VALID_JSON = re.compile("valid JSON")
+_M_MATCH_PAT = re.compile("match pattern")
+_M_NOT_MATCH = re.compile("not match")
+_M_NON_EMPTY = re.compile("non-empty")
+_M_EXPECTED = re.compile("Expected")
+_M_TYPE = re.compile("type")
+_M_SATISFY = re.compile("satisfy")
+_M_INVALID_REGEX = re.compile("Invalid regex")
+_M_UNKNOWN_REGEX_BACKEND = re.compile("Unknown regex backend")
+_M_UNKNOWN_JSON_BACKEND = re.compile("Unknown JSON backend")
 
 
 class TestExpect:
@@ -10,63 +41,63 @@ class TestExpect:
         expect("SELECT * FROM users").contains("SELECT").contains("FROM")
 
     def test_contains_fails(self):
-        with pytest.raises(ValidationError, match="contain"):
+        with pytest.raises(ValidationError, match=_M_CONTAIN):
             expect("hello world").contains("missing")
 
     def test_not_contains_passes(self):
         expect("SELECT * FROM users").not_contains("DROP").not_contains("DELETE")
 
     def test_not_contains_fails(self):
-        with pytest.raises(ValidationError, match="not contain"):
+        with pytest.raises(ValidationError, match=_M_NOT_CONTAIN):
             expect("DROP TABLE users").not_contains("DROP")
 
     def test_matches_passes(self):
-        expect("user_123").matches(r"user_\d+")
+        expect("user_123").matches(_USER_RE)
 
     def test_matches_fails(self):
-        with pytest.raises(ValidationError, match="match pattern"):
-            expect("invalid").matches(r"user_\d+")
+        with pytest.raises(ValidationError, match=_M_MATCH_PAT):
+            expect("invalid").matches(_USER_RE)
 
     def test_not_matches_passes(self):
-        expect("hello").not_matches(r"\d+")
+        expect("hello").not_matches(_DIGIT_RE)
 
     def test_not_matches_fails(self):
-        with pytest.raises(ValidationError, match="not match"):
-            expect("hello123").not_matches(r"\d+")
+        with pytest.raises(ValidationError, match=_M_NOT_MATCH):
+            expect("hello123").not_matches(_DIGIT_RE)
 
     def test_valid_json_passes(self):
         expect('{"key": "value"}').valid_json()
 
     def test_valid_json_fails(self):
-        with pytest.raises(ValidationError, match="valid JSON"):
+        with pytest.raises(ValidationError, match=_M_VALID_JSON):
             expect("not json").valid_json()
 
     def test_max_length_passes(self):
         expect("short").max_length(10)
 
     def test_max_length_fails(self):
-        with pytest.raises(ValidationError, match="length"):
+        with pytest.raises(ValidationError, match=_M_LENGTH):
             expect("this is too long").max_length(5)
 
     def test_min_length_passes(self):
         expect("hello").min_length(3)
 
     def test_min_length_fails(self):
-        with pytest.raises(ValidationError, match="length"):
+        with pytest.raises(ValidationError, match=_M_LENGTH):
             expect("hi").min_length(5)
 
     def test_not_empty_passes(self):
         expect("content").not_empty()
 
     def test_not_empty_fails(self):
-        with pytest.raises(ValidationError, match="non-empty"):
+        with pytest.raises(ValidationError, match=_M_NON_EMPTY):
             expect("   ").not_empty()
 
     def test_equals_passes(self):
         expect(42).equals(42)
 
     def test_equals_fails(self):
-        with pytest.raises(ValidationError, match="Expected"):
+        with pytest.raises(ValidationError, match=_M_EXPECTED):
             expect(42).equals(43)
 
     def test_is_type_passes(self):
@@ -75,14 +106,14 @@ class TestExpect:
         expect([1, 2]).is_type(list)
 
     def test_is_type_fails(self):
-        with pytest.raises(ValidationError, match="type"):
+        with pytest.raises(ValidationError, match=_M_TYPE):
             expect("hello").is_type(int)
 
     def test_satisfies_passes(self):
         expect(10).satisfies(lambda x: x > 5)
 
     def test_satisfies_fails(self):
-        with pytest.raises(ValidationError, match="satisfy"):
+        with pytest.raises(ValidationError, match=_M_SATISFY):
             expect(3).satisfies(lambda x: x > 5, "x > 5")
 
     def test_chaining(self):
@@ -94,102 +125,79 @@ class TestExpect:
         assert exp.value == "hello"
 
 
-class TestCheck:
-    def test_check_contains_passes(self):
-        @check(contains=["SELECT", "FROM"])
-        def sql_query():
-            return "SELECT * FROM users"
-
-        assert sql_query() == "SELECT * FROM users"
-
-    def test_check_contains_fails(self):
-        @check(contains=["SELECT"])
-        def sql_query():
-            return "invalid query"
-
-        with pytest.raises(ValidationError):
-            sql_query()
-
-    def test_check_not_contains_passes(self):
-        @check(not_contains=["DROP", "DELETE"])
-        def safe_query():
-            return "SELECT * FROM users"
-
-        assert safe_query() == "SELECT * FROM users"
-
-    def test_check_not_contains_fails(self):
-        @check(not_contains=["DROP"])
-        def dangerous_query():
-            return "DROP TABLE users"
-
-        with pytest.raises(ValidationError):
-            dangerous_query()
-
-    def test_check_valid_json(self):
-        @check(valid_json=True)
-        def json_response():
-            return '{"status": "ok"}'
-
-        assert json_response() == '{"status": "ok"}'
-
-    def test_check_valid_json_fails(self):
-        @check(valid_json=True)
-        def bad_json():
-            return "not json"
-
-        with pytest.raises(ValidationError):
-            bad_json()
-
-    def test_check_max_length(self):
-        @check(max_length=20)
-        def short_response():
-            return "brief"
-
-        assert short_response() == "brief"
-
-    def test_check_max_length_fails(self):
-        @check(max_length=5)
-        def long_response():
-            return "this is way too long"
-
-        with pytest.raises(ValidationError):
-            long_response()
-
-    def test_check_not_empty(self):
-        @check(not_empty=True)
-        def content():
-            return "hello"
-
-        assert content() == "hello"
-
-    def test_check_not_empty_fails(self):
-        @check(not_empty=True)
-        def empty():
-            return ""
-
-        with pytest.raises(ValidationError):
-            empty()
-
-    def test_check_matches(self):
-        @check(matches=r"^\d{4}-\d{2}-\d{2}$")
-        def date_string():
-            return "2026-02-03"
+# (rules, decorated function, expected return value)
+CASES = [
+    pytest.param(
+        {"contains": ["SELECT", "FROM"]},
+        lambda: "SELECT * FROM users",
+        "SELECT * FROM users",
+        id="contains",
+    ),
+    pytest.param(
+        {"not_contains": ["DROP", "DELETE"]},
+        lambda: "SELECT * FROM users",
+        "SELECT * FROM users",
+        id="not_contains",
+    ),
+    pytest.param(
+        {"valid_json": True},
+        lambda: '{"status": "ok"}',
+        '{"status": "ok"}',
+        id="valid_json",
+    ),
+    pytest.param({"max_length": 20}, lambda: "brief", "brief", id="max_length"),
+    pytest.param({"not_empty": True}, lambda: "hello", "hello", id="not_empty"),
+    pytest.param(
+        {"matches": _DATE_RE}, lambda: "2026-02-03", "2026-02-03", id="matches"
+    ),
+    pytest.param(
+        {"matches": [_SELECT_RE, _FROM_RE]},
+        lambda: "SELECT * FROM users",
+        "SELECT * FROM users",
+        id="matches_list",
+    ),
+    pytest.param(
+        {"satisfies": lambda x: len(x) > 5},
+        lambda: "hello world",
+        "hello world",
+        id="satisfies",
+    ),
+]
+
+# (rules, decorated function, rule reported by the ValidationError)
+FAIL_CASES = [
+    pytest.param(
+        {"contains": ["SELECT"]}, lambda: "invalid query", "contains", id="contains"
+    ),
+    pytest.param(
+        {"not_contains": ["DROP"]},
+        lambda: "DROP TABLE users",
+        "not_contains",
+        id="not_contains",
+    ),
+    pytest.param(
+        {"valid_json": True}, lambda: "not json", "valid_json", id="valid_json"
+    ),
+    pytest.param(
+        {"max_length": 5},
+        lambda: "this is way too long",
+        "max_length",
+        id="max_length",
+    ),
+    pytest.param({"not_empty": True}, lambda: "", "not_empty", id="not_empty"),
+]
 
-        assert date_string() == "2026-02-03"
 
-    def test_check_matches_list(self):
-        @check(matches=[r"SELECT", r"FROM"])
-        def query():
-            return "SELECT * FROM users"
-
-        assert query() == "SELECT * FROM users"
-
-    def test_check_satisfies(self):
-        @check(satisfies=lambda x: len(x) > 5)
-        def long_enough():
-            return "hello world"
+class TestCheck:
+    @pytest.mark.parametrize("rules,fn,expected", CASES)
+    def test_check_case(self, rules, fn, expected):
+        assert check(**rules)(fn)() == expected
 
-        assert long_enough() == "hello world"
+    @pytest.mark.parametrize("rules,fn,rule", FAIL_CASES)
+    def test_check_fail_case(self, rules, fn, rule):
+        with pytest.raises(ValidationError) as exc:
+            check(**rules)(fn)()
+        assert exc.value.rule == rule
 
     def test_check_satisfies_fails(self):
         @check(satisfies=lambda x: len(x) > 100)
@@ -250,6 +258,77 @@ class TestCheck:
         assert returns_none() is None
 
 
+class TestCheckMany:
+    def test_check_many_mask(self):
+        results = [
+            "SELECT * FROM users",
+            "DROP TABLE users",
+            "",
+            "SELECT id FROM orders",
+        ]
+        passed = check_many(
+            results,
+            contains=["SELECT"],
+            not_contains=["DROP"],
+            matches=r"FROM \w+$",
+            not_empty=True,
+        )
+        assert passed == [True, False, False, True]
+
+    def test_check_many_agrees_with_check(self):
+        rules = {"valid_json": True, "max_length": 10, "satisfies": lambda x: x}
+        results = ['{"a": 1}', "not json", '{"long": "value"}', "[]", None]
+
+        @check(**rules, on_fail=lambda e: "failed")
+        def identity(value):
+            return value
+
+        expected = [identity(r) != "failed" for r in results]
+        assert check_many(results, **rules) == expected
+
+    def test_check_many_no_rules(self):
+        assert check_many(["a", None, 0]) == [True, True, True]
+        assert check_many([]) == []
+
+    def test_check_batch_matches_loop_semantics(self):
+        rules = {
+            "contains": ["SELECT"],
+            "not_contains": ["DROP", "DELETE", "TRUNCATE"],
+            "matches": _FROM_RE,
+            "max_length": 30,
+        }
+        results = [
+            "SELECT * FROM users",
+            "SELECT 1; DELETE FROM users",
+            "SELECT 1",
+            "SELECT * FROM users WHERE name = 'john'",
+        ]
+
+        def validate(value):
+            @check(**rules)
+            def returns():
+                return value
+
+            try:
+                returns()
+            except ValidationError as e:
+                return e
+            return None
+
+        expected = [validate(r) for r in results]
+        errors = check_batch(results, **rules)
+        assert [e and (e.rule, e.message, e.value) for e in errors] == [
+            e and (e.rule, e.message, e.value) for e in expected
+        ]
+        assert [e.rule if e else None for e in errors] == [
+            None, "not_contains", "matches", "max_length"
+        ]
+
+    def test_check_many_invalid_regex(self):
+        with pytest.raises(ValidationError, match=_M_INVALID_REGEX):
+            check_many(["a"], matches="[invalid")
+
+
 class TestValidationError:
     def test_error_attributes(self):
         err = ValidationError("test message", value="test value", rule="test_rule")
@@ -292,6 +371,34 @@ class TestCheckMoreCases:
 
         assert long_enough() == "hello world"
 
+    def test_check_assume_verified_once(self):
+        """Test that assumed rules stop being checked after one pass."""
+        outputs = iter(["result_1", "no prefix"])
+
+        @check(not_empty=True, assume={"contains": ["result"]})
+        def agent():
+            return next(outputs)
+
+        assert agent() == "result_1"
+        assert agent() == "no prefix"
+
+    def test_check_assume_failure_keeps_verifying(self):
+        """Test that a failed assumption is reported and checked again."""
+        outputs = iter(["bad", "result_2", "bad"])
+
+        @check(assume={"contains": ["result"]}, on_fail=lambda e: e.rule)
+        def agent():
+            return next(outputs)
+
+        assert agent() == "contains"
+        assert agent() == "result_2"
+        assert agent() == "bad"
+
+    def test_check_assume_unknown_rule(self):
+        """Test that misspelled assumptions are rejected when decorating."""
+        with pytest.raises(TypeError):
+            check(assume={"contain": ["x"]})
+
     def test_check_min_length_fails(self):
         """Test @check with min_length failure."""
         @check(min_length=100)
@@ -300,3 +407,268 @@ class TestCheckMoreCases:
 
         with pytest.raises(ValidationError):
             too_short()
+
+
+class TestExpectBytes:
+    def test_contains(self):
+        expect_bytes(b"SELECT * FROM users").contains(b"SELECT").not_contains(b"DROP")
+        with pytest.raises(ValidationError, match=_M_CONTAIN):
+            expect_bytes(b"hello").contains(b"missing")
+        with pytest.raises(ValidationError, match=_M_NOT_CONTAIN):
+            expect_bytes(b"DROP TABLE").not_contains(b"DROP")
+
+    def test_matches(self):
+        expect_bytes(b"user_123").matches(rb"user_\d+").not_matches(rb"^\d+$")
+        with pytest.raises(ValidationError, match=_M_MATCH_PAT):
+            expect_bytes(b"invalid").matches(rb"user_\d+")
+        with pytest.raises(ValidationError, match=_M_INVALID_REGEX):
+            expect_bytes(b"test").matches(b"[invalid")
+
+    def test_bytes_patterns_cached(self):
+        from evalguard.core import _compile_bytes
+
+        before = _compile_bytes.cache_info().hits
+        expect_bytes(b"id_42").matches(rb"id_\d+")
+        expect_bytes(b"id_43").matches(rb"id_\d+")
+        assert _compile_bytes.cache_info().hits > before
+
+    def test_valid_json(self):
+        expect_bytes(b'{"key": "value"}').valid_json()
+        expect_bytes('{"key": "значение"}'.encode("utf-16")).valid_json()
+        with pytest.raises(ValidationError, match=_M_VALID_JSON):
+            expect_bytes(b"not json").valid_json()
+        with pytest.raises(ValidationError, match=_M_VALID_JSON):
+            expect_bytes(b"\xff").valid_json()
+
+    def test_lengths_count_bytes(self):
+        data = "é".encode()
+        expect_bytes(data).max_length(2).min_length(2)
+        with pytest.raises(ValidationError, match=_M_LENGTH):
+            expect_bytes(data).max_length(1)
+
+    def test_not_empty(self):
+        expect_bytes(b"content").not_empty()
+        with pytest.raises(ValidationError, match=_M_NON_EMPTY):
+            expect_bytes(b" \r\n").not_empty()
+
+    def test_equals_satisfies_value(self):
+        exp = expect_bytes(b"ok").equals(b"ok").satisfies(lambda b: b.isalpha())
+        assert exp.value == b"ok"
+        with pytest.raises(ValidationError, match=_M_SATISFY):
+            expect_bytes(b"ok").satisfies(lambda b: len(b) > 5, "len > 5")
+
+
+class TestConfigure:
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError, match=_M_UNKNOWN_REGEX_BACKEND):
+            configure(regex_backend="perl")
+
+    def test_re2_backend(self):
+        pytest.importorskip("re2")
+        configure(regex_backend="re2")
+        try:
+            expect("user_123").matches(r"user_\d+")
+            # Backtracking-prone pattern finishes immediately under RE2
+            expect("a" * 40 + "b").not_matches(r"(a+)+$")
+
+            @check(matches=r"^\d{4}-\d{2}-\d{2}$", not_matches=r"(a+)+$")
+            def date_string():
+                return "2026-02-03"
+
+            assert date_string() == "2026-02-03"
+        finally:
+            configure(regex_backend="re")
+
+    def test_re2_fused_not_matches(self):
+        pytest.importorskip("re2")
+        configure(regex_backend="re2")
+        try:
+            @check(not_matches=[r"rm\s+-rf", r"\d{3}-\d{2}-\d{4}", r"(?i)drop"])
+            def reply(text):
+                return text
+
+            assert reply("all good") == "all good"
+            with pytest.raises(ValidationError) as exc:
+                reply("DROP it, then rm  -rf /")
+            assert "rm" in exc.value.message
+            with pytest.raises(ValidationError) as exc:
+                reply("please Drop")
+            assert "drop" in exc.value.message
+        finally:
+            configure(regex_backend="re")
+
+    def test_re2_lone_surrogates(self):
+        import json
+
+        pytest.importorskip("re2")
+        configure(regex_backend="re2")
+        try:
+            # RE2 matches UTF-8; text it cannot encode is searched with re
+            text = json.loads('"2026-02-03 \\ud800"')
+            expect(text).matches(r"^\d{4}").not_matches(r"DROP")
+            with pytest.raises(ValidationError, match=_M_NOT_MATCH):
+                expect(text).not_matches(r"03 .")
+            # \z is RE2-only syntax: surrogates are replaced instead
+            expect("x\ud800").matches(r"x.\z")
+
+            @check(matches=r"^\d", not_matches=[r"DROP", r"\d{5}"])
+            def reply():
+                return text
+
+            assert reply() == text
+
+            @check(not_matches=[r"DROP", r"03 ."], on_fail=lambda e: e.rule)
+            def flagged():
+                return text
+
+            assert flagged() == "not_matches"
+        finally:
+            configure(regex_backend="re")
+
+    def test_re2_documented_differences(self):
+        pytest.importorskip("re2")
+        configure(regex_backend="re2")
+        try:
+            # $ does not match before a trailing newline; \d is ASCII-only
+            with pytest.raises(ValidationError, match=_M_MATCH_PAT):
+                expect("done\n").matches(r"^done$")
+            with pytest.raises(ValidationError, match=_M_MATCH_PAT):
+                expect("\u0663").matches(r"\d")
+        finally:
+            configure(regex_backend="re")
+
+    def test_check_accepts_precompiled_re2_patterns(self):
+        re2 = pytest.importorskip("re2")
+        pattern = re2.compile(r"DROP\s+TABLE")
+        for backend in ("re", "re2"):
+            configure(regex_backend=backend)
+            try:
+                @check(matches=re2.compile(r"SELECT"), not_matches=[pattern])
+                def reply(text):
+                    return text
+
+                assert reply("SELECT 1") == "SELECT 1"
+                with pytest.raises(ValidationError, match=_M_NOT_MATCH):
+                    reply("SELECT 1; DROP  TABLE users")
+            finally:
+                configure(regex_backend="re")
+
+    def test_re2_keeps_compiled_re_patterns(self):
+        import re
+
+        pytest.importorskip("re2")
+        configure(regex_backend="re2")
+        try:
+            # re semantics: $ matches before a trailing newline
+            @check(matches=re.compile(r"done$"), not_matches=[re.compile("x"), "y"])
+            def reply():
+                return "done\n"
+
+            assert reply() == "done\n"
+        finally:
+            configure(regex_backend="re")
+
+    def test_pcre2_jit_backend(self):
+        pytest.importorskip("pcre2")
+        configure(regex_backend="pcre2-jit")
+        try:
+            expect("user_123").matches(r"user_\d+").not_matches(r"\bdrop\s+table")
+            with pytest.raises(ValidationError, match=_M_MATCH_PAT):
+                expect("invalid").matches(r"user_\d+")
+            with pytest.raises(ValidationError, match=_M_INVALID_REGEX):
+                expect("test").matches("[invalid")
+
+            @check(matches=[r"\d{4}-\d{2}", r"(?<=-)\d{2}$"], not_matches=r"x")
+            def date_string():
+                return "2026-02"
+
+            assert date_string() == "2026-02"
+        finally:
+            configure(regex_backend="re")
+
+    def test_pcre2_match_limit_and_surrogates(self):
+        import json
+
+        pytest.importorskip("pcre2")
+        configure(regex_backend="pcre2-jit")
+        try:
+            hostile = "a" * 40 + "b"
+            with pytest.raises(ValidationError) as exc:
+                expect(hostile).not_matches(r"(a+)+$")
+            assert exc.value.rule == "not_matches"
+            assert "match limit" in exc.value.message
+            with pytest.raises(ValidationError) as exc:
+                expect(hostile).matches(r"(a+)+$")
+            assert exc.value.rule == "matches"
+
+            # Match-limit failures reach on_fail like any other failure
+            @check(not_matches=r"(a+)+$", on_fail=lambda e: e.rule)
+            def reply():
+                return hostile
+
+            assert reply() == "not_matches"
+            assert check_many([hostile], matches=r"(a+)+$") == [False]
+
+            # PCRE2 matches UTF-8; text it cannot encode is searched with re
+            text = json.loads('"user_1 \\ud800"')
+            expect(text).matches(r"user_\d+").not_matches(r"(?<=-)\d")
+
+            @check(matches=r"user_\d+", not_matches=r"1 .$")
+            def flagged():
+                return text
+
+            with pytest.raises(ValidationError, match=_M_NOT_MATCH):
+                flagged()
+        finally:
+            configure(regex_backend="re")
+
+    def test_unknown_json_backend(self):
+        with pytest.raises(ValueError, match=_M_UNKNOWN_JSON_BACKEND):
+            configure(json_backend="yaml")
+
+    def test_simdjson_backend(self):
+        import json
+
+        pytest.importorskip("simdjson")
+        configure(json_backend="simdjson")
+        try:
+            expect('{"key": [1, 2.5, "value"]}').valid_json()
+            expect_bytes(b'{"key": "value"}').valid_json()
+            # Accepted by json.loads but not simdjson: still valid
+            expect("NaN").valid_json()
+            expect("1" * 100).valid_json()
+            expect_bytes('{"a": 1}'.encode("utf-16")).valid_json()
+
+            with pytest.raises(json.JSONDecodeError) as expected:
+                json.loads("[1,]")
+            with pytest.raises(ValidationError) as exc:
+                expect("[1,]").valid_json()
+            assert exc.value.message == f"Expected valid JSON: {expected.value}"
+
+            # simdjson skips a BOM that json.loads rejects in str input
+            for text in ["\ufeff{}", "\ufeff[1]"]:
+                with pytest.raises(json.JSONDecodeError) as expected:
+                    json.loads(text)
+                with pytest.raises(ValidationError) as exc:
+                    expect(text).valid_json()
+                assert exc.value.message == f"Expected valid JSON: {expected.value}"
+            json.loads(b"\xef\xbb\xbf{}")
+            expect_bytes(b"\xef\xbb\xbf{}").valid_json()
+
+            @check(valid_json=True)
+            def response():
+                return '{"status": "ok"}'
+
+            assert response() == '{"status": "ok"}'
+        finally:
+            configure(json_backend="json")
+
+    def test_re2_falls_back_for_unsupported_syntax(self):
+        pytest.importorskip("re2")
+        configure(regex_backend="re2")
+        try:
+            expect("abab").matches(r"(ab)\1")
+            with pytest.raises(ValidationError, match=_M_INVALID_REGEX):
+                expect("test").matches("[invalid")
+        finally:
+            configure(regex_backend="re")